@@ -5,13 +5,20 @@ CLI-first for rituals. Obsidian for viewing.
 """
 
 import json
-import re
-import time
-import random
+import os
+import shutil
+import sys
 from datetime import date, datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # optional speedup; the stdlib encoder works the same here
+    orjson = None
+
 CONFIG_PATH = Path(__file__).parent / "config.json"
+DEFAULT_ALIGNMENT_PATH = "75z/Systems/Alignment.md"
 
 # ─── Config ──────────────────────────────────────────────────────────────────
 
@@ -22,60 +29,199 @@ def load_config():
             cfg = json.load(f)
         cfg["vault_path"] = Path(cfg["vault_path"]).expanduser()
         return cfg
-    return {"vault_path": Path.home() / "obsidian", "alignment_path": "75z/Systems/Alignment.md"}
+    return {"vault_path": Path.home() / "obsidian", "alignment_path": DEFAULT_ALIGNMENT_PATH}
 
 
 CFG = load_config()
 VAULT = CFG["vault_path"]
 Z = VAULT / "75z"
+ALIGNMENT_PATH = VAULT / CFG.get("alignment_path", DEFAULT_ALIGNMENT_PATH)
+
+
+# Static screen pieces, built once instead of on every redraw
+RULE = "─" * 60
+RULE_SHORT = "─" * 50
+RULE_HEAVY = "=" * 60
+RULE_INDENT = "  " + "-" * 58
+MENU_COMMANDS = "Commands: a m c e h t 4 w v p s r i q"
+CHECKBOX = ("[ ]", "[x]")  # indexed by a bool "done" flag
+# Piped/redirected output gets plain text: no clears, no cursor moves
+IS_TTY = sys.stdout.isatty()
+CLEAR_SCREEN = "\033[2J\033[H" if IS_TTY else ""
+
+_last_frame = None
 
 
 def clear():
-    print("\033[2J\033[H", end="")
+    global _last_frame
+    _last_frame = None
+    sys.stdout.write(CLEAR_SCREEN)
+
+
+def render(lines):
+    """Draw a frame, repainting only rows that changed since the last one."""
+    global _last_frame
+    cols, rows = shutil.get_terminal_size()
+    # Deltas address rows from the top, so they only hold while the frame plus
+    # the echoed input line fit on screen and no line wraps
+    fits = len(lines) + 1 < rows and all(len(line) < cols for line in lines)
+    if _last_frame is None or not IS_TTY or not fits:
+        out = [CLEAR_SCREEN, "\n".join(lines), "\n"]
+    else:
+        out = [
+            f"\033[{i+1};1H\033[2K{line}"
+            for i, line in enumerate(lines)
+            if i >= len(_last_frame) or _last_frame[i] != line
+        ]
+        # Park below the frame and wipe leftovers (echoed input, longer old frame)
+        out.append(f"\033[{len(lines)+1};1H\033[J")
+    # A scrolled or wrapped frame doesn't match the screen rows, so it can't be a delta base
+    _last_frame = lines if fits else None
+    sys.stdout.write("".join(out))
+    sys.stdout.flush()
+
+
+def pause(prompt="Press Enter to continue..."):
+    """Wait for Enter."""
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    sys.stdin.readline()
+
+
+def parse_int(text):
+    """Return text as an int (optionally signed), or None if it isn't one."""
+    digits = text[1:] if text[:1] in ("+", "-") else text
+    return int(text) if digits.isdecimal() else None
 
 
 # ─── Daily Note I/O ──────────────────────────────────────────────────────────
 
 
+def json_loads(raw):
+    """Decode JSON bytes, via orjson when it is installed."""
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+
+def json_dumps(obj):
+    """Encode obj as compact JSON bytes, via orjson when it is installed."""
+    if orjson:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+@lru_cache(maxsize=16)
+def day_paths(d):
+    """(markdown, sidecar) paths for a date."""
+    stem = Z / "Daily" / d.isoformat()
+    return stem.with_suffix(".md"), stem.with_suffix(".json")
+
+
 def daily_path(d=None):
-    d = d or date.today()
-    return Z / "Daily" / f"{d.isoformat()}.md"
+    return day_paths(d or date.today())[0]
 
 
 def sidecar_path(d=None):
-    d = d or date.today()
-    return Z / "Daily" / f"{d.isoformat()}.json"
+    return day_paths(d or date.today())[1]
+
+
+# Saves call ensure_dirs() every time; write_atomic resets this if a folder vanishes
+_dirs_ready = False
 
 
 def ensure_dirs():
+    global _dirs_ready
+    if _dirs_ready:
+        return
     for sub in ["Daily", "Weekly", "Thinking", "Inbox", "Systems"]:
         (Z / sub).mkdir(parents=True, exist_ok=True)
+    _dirs_ready = True
+
+
+def read_file(path):
+    """Read a whole file as bytes."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, os.fstat(fd).st_size + 1)
+    finally:
+        os.close(fd)
+
+
+def write_file(path, data):
+    """Write bytes to path, replacing its contents."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def write_atomic(path, data):
+    """Write bytes to a temp file next to path, then rename it over path."""
+    global _dirs_ready
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        write_file(tmp, data)
+    except FileNotFoundError:
+        # A vault folder was removed mid-session: recreate the folders and retry once
+        _dirs_ready = False
+        ensure_dirs()
+        write_file(tmp, data)
+    tmp.replace(path)
+
+
+def cached_by_mtime(cache, path, load):
+    """Return load(path), cached until the file's mtime changes; None if missing."""
+    try:
+        mtime = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+    cached = cache.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    value = load(path)
+    cache[path] = (mtime, value)
+    return value
+
+
+# sidecar path -> (mtime_ns, data); a file is re-parsed only after it changes
+_sidecar_cache = {}
 
 
 def load_sidecar(d=None):
-    p = sidecar_path(d)
-    if p.exists():
-        with open(p) as f:
-            return json.load(f)
-    return {
-        "date": (d or date.today()).isoformat(),
-        "reconciled": False,
-        "energy_sleep": None,
-        "energy_movement": None,
-        "energy_fuel": None,
-        "mits": [],
-        "mit_done": [],
-        "captures": [],
-        "habits": [],
-        "streak_slip": False,
-    }
+    d = d or date.today()
+    data = cached_by_mtime(_sidecar_cache, sidecar_path(d), lambda p: json_loads(read_file(p)))
+    if data is None:
+        return {
+            "date": d.isoformat(),
+            "reconciled": False,
+            "energy_sleep": None,
+            "energy_movement": None,
+            "energy_fuel": None,
+            "mits": [],
+            "mit_done": [],
+            "captures": [],
+            "habits": [],
+            "streak_slip": False,
+        }
+    return data
 
 
 def save_sidecar(data, d=None):
-    ensure_dirs()
     p = sidecar_path(d)
-    with open(p, "w") as f:
-        json.dump(data, f, indent=2)
+    # Compact output; the .md note is the readable copy
+    write_atomic(p, json_dumps(data))
+    _sidecar_cache[p] = (p.stat().st_mtime_ns, data)
+
+
+RECONCILE_SECTION = (
+    "## Reconcile\n"
+    "**RESULT:** {result}\n"
+    "**ATTENTION HELD:** {attention}\n"
+    "**DRIFT:** {drift}\n"
+    "**TOMORROW LOCK:** {tomorrow}\n"
+)
 
 
 def render_daily_note(data):
@@ -87,7 +233,7 @@ def render_daily_note(data):
     habits = data.get("habits", [])
 
     mit_count = len(mits)
-    mit_done_count = sum(1 for x in mit_done if x)
+    mit_done_count = sum(map(bool, mit_done))
 
     # Frontmatter
     fm = [
@@ -111,8 +257,8 @@ def render_daily_note(data):
     mits_set = mit_count > 0
     lines += [
         "## Morning Startup",
-        f"- [{'x' if alignment_done else ' '}] Read alignment",
-        f"- [{'x' if mits_set else ' '}] Set MITs",
+        f"- {CHECKBOX[alignment_done]} Read alignment",
+        f"- {CHECKBOX[mits_set]} Set MITs",
         "",
     ]
 
@@ -121,7 +267,7 @@ def render_daily_note(data):
     if mits:
         for i, mit in enumerate(mits):
             done = mit_done[i] if i < len(mit_done) else False
-            lines.append(f"{i+1}. [{'x' if done else ' '}] {mit}")
+            lines.append(f"{i+1}. {CHECKBOX[bool(done)]} {mit}")
     else:
         lines += ["1. [ ]", "2. [ ]", "3. [ ]"]
     lines.append("")
@@ -149,18 +295,18 @@ def render_daily_note(data):
     ]
 
     # Reconcile
-    lines.append("## Reconcile")
-    lines.append(f"**RESULT:** {data.get('result', '')}")
-    lines.append(f"**ATTENTION HELD:** {data.get('attention', '')}")
-    lines.append(f"**DRIFT:** {data.get('drift', '')}")
-    lines.append(f"**TOMORROW LOCK:** {data.get('tomorrow', '')}")
-    lines.append("")
+    lines.append(RECONCILE_SECTION.format(
+        result=data.get("result", ""),
+        attention=data.get("attention", ""),
+        drift=data.get("drift", ""),
+        tomorrow=data.get("tomorrow", ""),
+    ))
 
     # Habits
     lines.append("## Habits")
     if habits:
         for h in habits:
-            lines.append(f"- [{'x' if h.get('done') else ' '}] {h['name']}")
+            lines.append(f"- {CHECKBOX[bool(h.get('done'))]} {h['name']}")
     else:
         # Load default habits
         for name in load_habit_names():
@@ -170,24 +316,63 @@ def render_daily_note(data):
     return "\n".join(lines)
 
 
-def save_daily(data, d=None):
-    """Save both sidecar JSON and rendered markdown daily note."""
+# note path -> (mtime_ns, markdown) as last read or written
+_note_cache = {}
+
+
+def save_daily(data, d):
+    """Save both sidecar JSON and rendered markdown daily note for day d."""
     ensure_dirs()
     save_sidecar(data, d)
     md = render_daily_note(data)
     dp = daily_path(d)
-    dp.write_text(md)
+    # Skip the rewrite when the note on disk is exactly what we'd write
+    if cached_by_mtime(_note_cache, dp, lambda p: read_file(p).decode(errors="replace")) != md:
+        write_atomic(dp, md.encode())
+        _note_cache[dp] = (dp.stat().st_mtime_ns, md)
+
+
+# ─── Reference Docs ──────────────────────────────────────────────────────────
+
+SYSTEM_DOCS = {
+    "1": "Alignment.md",
+    "2": "Default Day.md",
+    "3": "Minimum Viable Day.md",
+    "4": "If-Then Plans.md",
+    "5": "Habit Stacks.md",
+}
+
+SYSTEMS_MENU = "\n".join(
+    ["SYSTEMS\n"]
+    + [f"  {num} — {name.removesuffix('.md')}" for num, name in SYSTEM_DOCS.items()]
+    + ["\n  b — Back\n"]
+)
+
+# path -> (mtime_ns, text) for reference docs, re-read only after an edit
+_doc_cache = {}
+
+
+def read_doc(p):
+    """Return the text of a reference doc, or None if it doesn't exist."""
+    return cached_by_mtime(_doc_cache, p, Path.read_text)
 
 
 # ─── Habits ──────────────────────────────────────────────────────────────────
 
+DEFAULT_HABITS = ["Morning alignment read", "3 MITs set", "Movement (any)", "Evening reconcile"]
+
+# Habit Stacks.md path -> (mtime_ns, names), re-parsed only after an edit
+_habit_cache = {}
+
 
 def load_habit_names():
-    """Parse habit names from Systems/Habit Stacks.md 'Tracked Daily' section."""
-    p = Z / "Systems" / "Habit Stacks.md"
-    if not p.exists():
-        return ["Morning alignment read", "3 MITs set", "Movement (any)", "Evening reconcile"]
+    """Habit names from Systems/Habit Stacks.md, or the defaults if it's missing."""
+    names = cached_by_mtime(_habit_cache, Z / "Systems" / "Habit Stacks.md", parse_habit_names)
+    return names if names is not None else DEFAULT_HABITS
 
+
+def parse_habit_names(p):
+    """Parse habit names from the 'Tracked Daily' section of a habit stacks file."""
     text = p.read_text()
     names = []
     in_section = False
@@ -198,16 +383,20 @@ def load_habit_names():
         if in_section:
             if line.startswith("##"):
                 break
-            m = re.match(r"- \[.\] (.+)", line)
-            if m:
-                names.append(m.group(1).strip())
-    return names or ["Morning alignment read", "3 MITs set", "Movement (any)", "Evening reconcile"]
+            # "- [ ] Name": checkbox at a fixed offset, name from column 6
+            if line.startswith("- [") and line[4:6] == "] " and len(line) > 6:
+                names.append(line[6:].strip())
+    return names or DEFAULT_HABITS
 
 
 def ensure_habits(data):
     """Ensure today's data has a habits list matching the habit definitions."""
     names = load_habit_names()
-    existing = {h["name"]: h for h in data.get("habits", [])}
+    current = data.get("habits", [])
+    # Common case: already in sync, so keep the list instead of rebuilding it
+    if len(current) == len(names) and all(h["name"] == n for h, n in zip(current, names)):
+        return data
+    existing = {h["name"]: h for h in current}
     habits = []
     for name in names:
         if name in existing:
@@ -218,6 +407,16 @@ def ensure_habits(data):
     return data
 
 
+def mark_habit(data, name):
+    """Mark the named habit done. Returns True if that changed anything."""
+    changed = False
+    for h in data["habits"]:
+        if h["name"] == name and not h.get("done"):
+            h["done"] = True
+            changed = True
+    return changed
+
+
 # ─── Thinking Prompts ────────────────────────────────────────────────────────
 
 PROMPTS = [
@@ -233,6 +432,32 @@ PROMPTS = [
     {"id": "surrender", "text": "What do I need to let go of?", "theme": "Release"},
 ]
 
+# "n. [theme] text" rows for the prompt list; only the used mark varies
+PROMPT_ROWS = [f"{i}. [{p['theme']}] {p['text']}" for i, p in enumerate(PROMPTS, 1)]
+
+
+def render_thinking_note(log):
+    """Render the day's thinking sessions as markdown."""
+    d = log["date"]
+    sessions = log["sessions"]
+    parts = [
+        f"---\ndate: {d}\nsessions: {len(sessions)}\n---\n\n",
+        f"# Thinking Sessions — {d}\n\n",
+    ]
+
+    for i, s in enumerate(sessions, 1):
+        # Stored via datetime.isoformat(), so HH:MM sits at a fixed offset
+        ts = s["timestamp"][11:16]
+        parts.append(f"## Session {i} — {ts}\n")
+        parts.append(f"**Theme:** {s['theme']}\n\n")
+        parts.append(f"**Prompt:** {s['prompt']}\n\n")
+        if s.get("freewrite"):
+            parts.append(f"### Expansion\n{s['freewrite']}\n\n")
+        parts.append(f"### Insight\n{s['insight']}\n\n")
+        parts.append("---\n\n")
+
+    return "".join(parts)
+
 
 # ─── Commands ─────────────────────────────────────────────────────────────────
 
@@ -240,68 +465,65 @@ PROMPTS = [
 def cmd_alignment():
     """Morning alignment read."""
     clear()
-    p = VAULT / CFG["alignment_path"]
-    if p.exists():
-        print(p.read_text())
-        print("\n" + "─" * 60 + "\n")
+    text = read_doc(ALIGNMENT_PATH)
+    if text is not None:
+        print(text)
+        print("\n" + RULE + "\n")
     else:
         print("Alignment file not found.\n")
-        print(f"Expected at: {p}\n")
+        print(f"Expected at: {ALIGNMENT_PATH}\n")
 
-    # Mark habit
-    data = load_sidecar()
+    # Mark habit (rereading later in the day shouldn't rewrite the note)
+    today = date.today()
+    data = load_sidecar(today)
     data = ensure_habits(data)
-    for h in data["habits"]:
-        if h["name"] == "Morning alignment read":
-            h["done"] = True
-    save_daily(data)
+    if mark_habit(data, "Morning alignment read"):
+        save_daily(data, today)
 
-    input("Press Enter to continue...")
+    pause()
 
 
 def cmd_mits():
     """Set or update 3 Most Important Tasks."""
     clear()
-    data = load_sidecar()
+    today = date.today()
+    data = load_sidecar(today)
     data = ensure_habits(data)
 
     existing = data.get("mits", [])
     mit_done = data.get("mit_done", [])
 
     if existing:
-        print("CURRENT MITs\n")
+        out = ["CURRENT MITs\n"]
         for i, mit in enumerate(existing):
             done = mit_done[i] if i < len(mit_done) else False
-            print(f"  {'[x]' if done else '[ ]'} {i+1}. {mit}")
-        print()
-        print("  d - Mark done")
-        print("  n - Set new MITs")
-        print("  b - Back\n")
+            out.append(f"  {CHECKBOX[bool(done)]} {i+1}. {mit}")
+        out.append("\n  d - Mark done\n  n - Set new MITs\n  b - Back\n")
+        print("\n".join(out))
 
         choice = input("> ").strip().lower()
         if choice == "d":
             num = input("Which MIT? (1/2/3): ").strip()
-            try:
-                idx = int(num) - 1
-                if 0 <= idx < len(existing):
-                    while len(mit_done) <= idx:
-                        mit_done.append(False)
-                    mit_done[idx] = True
-                    data["mit_done"] = mit_done
-                    save_daily(data)
-                    print(f"\n  Done: {existing[idx]}\n")
-                else:
-                    print("\n  Invalid number.\n")
-            except ValueError:
+            n = parse_int(num)
+            idx = n - 1 if n is not None else None
+            if idx is None:
                 print("\n  Invalid input.\n")
-            input("Press Enter to continue...")
+            elif 0 <= idx < len(existing):
+                while len(mit_done) <= idx:
+                    mit_done.append(False)
+                mit_done[idx] = True
+                data["mit_done"] = mit_done
+                save_daily(data, today)
+                print(f"\n  Done: {existing[idx]}\n")
+            else:
+                print("\n  Invalid number.\n")
+            pause()
             return
         elif choice != "n":
             return
         print()
 
-    print("SET 3 MITs\n")
-    print("What are the 3 most important things to do today?\n")
+    print("SET 3 MITs\n\nWhat are the 3 most important things to do today?\n")
 
     mits = []
     for i in range(3):
@@ -312,15 +534,13 @@ def cmd_mits():
     if mits:
         data["mits"] = mits
         data["mit_done"] = [False] * len(mits)
-        for h in data["habits"]:
-            if h["name"] == "3 MITs set":
-                h["done"] = True
-        save_daily(data)
+        mark_habit(data, "3 MITs set")
+        save_daily(data, today)
         print(f"\n  {len(mits)} MIT(s) set.\n")
     else:
         print("\n  No MITs set.\n")
 
-    input("Press Enter to continue...")
+    pause()
 
 
 def cmd_capture():
@@ -331,50 +551,49 @@ def cmd_capture():
 
     if not text:
         print("\n  Nothing captured.\n")
-        input("Press Enter to continue...")
+        pause()
         return
 
-    ts = datetime.now().strftime("%H:%M")
+    # Read the clock once so the note, inbox and timestamp agree at midnight
+    now = datetime.now()
+    ts = now.strftime("%H:%M")
     capture = {"time": ts, "text": text}
 
     # Add to daily note
-    data = load_sidecar()
+    data = load_sidecar(now.date())
     data = ensure_habits(data)
     data.setdefault("captures", []).append(capture)
-    save_daily(data)
+    save_daily(data, now.date())
 
     # Also add to Inbox file
     inbox_dir = Z / "Inbox"
     inbox_dir.mkdir(parents=True, exist_ok=True)
-    inbox_path = inbox_dir / f"{date.today().isoformat()}.md"
-
-    if inbox_path.exists():
-        content = inbox_path.read_text()
-    else:
-        content = f"# Inbox — {date.today().isoformat()}\n"
+    today = now.date().isoformat()
+    inbox_path = inbox_dir / f"{today}.md"
 
-    content += f"\n- [{ts}] {text}"
-    inbox_path.write_text(content)
+    # Append instead of reading the whole inbox back and rewriting it
+    with open(inbox_path, "a") as f:
+        if f.tell() == 0:
+            f.write(f"# Inbox — {today}\n")
+        f.write(f"\n- [{ts}] {text}")
 
     print(f"\n  Captured at {ts}\n")
-    input("Press Enter to continue...")
+    pause()
 
 
 def cmd_energy():
     """Log energy: sleep, movement, fuel."""
     clear()
-    data = load_sidecar()
+    today = date.today()
+    data = load_sidecar(today)
     data = ensure_habits(data)
 
     print("ENERGY LOG\n")
 
     print("  Sleep quality (1-10):")
-    sleep = input("  → ").strip()
-    try:
-        sleep = int(sleep)
+    sleep = parse_int(input("  → ").strip())
+    if sleep is not None:
         sleep = max(1, min(10, sleep))
-    except ValueError:
-        sleep = None
 
     print("\n  Movement today:")
     movement = input("  → ").strip()
@@ -386,53 +605,60 @@ def cmd_energy():
     data["energy_movement"] = movement or None
     data["energy_fuel"] = fuel or None
 
-    save_daily(data)
+    save_daily(data, today)
     print("\n  Energy logged.\n")
-    input("Press Enter to continue...")
+    pause()
 
 
 def cmd_habits():
     """Toggle habits for today."""
     clear()
-    data = load_sidecar()
+    today = date.today()
+    data = load_sidecar(today)
     data = ensure_habits(data)
 
     habits = data["habits"]
 
-    while True:
-        clear()
-        print("HABITS\n")
-        for i, h in enumerate(habits):
-            print(f"  {'[x]' if h['done'] else '[ ]'} {i+1}. {h['name']}")
-        print(f"\n  Toggle (1-{len(habits)}) or b to go back\n")
-
-        choice = input("> ").strip().lower()
-        if choice == "b" or choice == "":
-            break
-        try:
-            idx = int(choice) - 1
-            if 0 <= idx < len(habits):
+    # Toggles stay in memory; the note is written once on the way out
+    changed = False
+    try:
+        while True:
+            frame = ["HABITS", ""]
+            for i, h in enumerate(habits):
+                frame.append(f"  {CHECKBOX[bool(h['done'])]} {i+1}. {h['name']}")
+            frame += ["", f"  Toggle (1-{len(habits)}) or b to go back", ""]
+            render(frame)
+
+            choice = input("> ").strip().lower()
+            if choice == "b" or choice == "":
+                break
+            n = parse_int(choice)
+            if n is not None and 0 < n <= len(habits):
+                idx = n - 1
                 habits[idx]["done"] = not habits[idx]["done"]
-                data["habits"] = habits
-                save_daily(data)
-        except ValueError:
-            pass
+                changed = True
+    finally:
+        if changed:
+            save_daily(data, today)
 
 
 def cmd_think():
     """Zen thinking session — 10 minutes of focused expansion."""
+    import random
+    import time
+
     clear()
 
     # Load today's thinking log
     thinking_dir = Z / "Thinking"
     thinking_dir.mkdir(parents=True, exist_ok=True)
-    thinking_json = thinking_dir / f"{date.today().isoformat()}.json"
+    today = date.today().isoformat()
+    thinking_json = thinking_dir / f"{today}.json"
 
-    if thinking_json.exists():
-        with open(thinking_json) as f:
-            thinking_log = json.load(f)
-    else:
-        thinking_log = {"date": date.today().isoformat(), "sessions": []}
+    try:
+        thinking_log = json_loads(read_file(thinking_json))
+    except FileNotFoundError:
+        thinking_log = {"date": today, "sessions": []}
 
     used_today = {s["prompt_id"] for s in thinking_log.get("sessions", [])}
     unused = [p for p in PROMPTS if p["id"] not in used_today]
@@ -440,50 +666,49 @@ def cmd_think():
         unused = PROMPTS
 
     # Choose prompt
-    print("ZEN THINKING\n")
-    print("  s — Suggested prompt")
-    print("  l — List all prompts\n")
+    print("ZEN THINKING\n\n  s — Suggested prompt\n  l — List all prompts\n")
 
     choice = input("  → ").strip().lower()
 
     if choice == "l":
         clear()
-        print("ALL PROMPTS\n")
-        for i, p in enumerate(PROMPTS, 1):
-            used = "x" if p["id"] in used_today else " "
-            print(f"  [{used}] {i}. [{p['theme']}] {p['text']}")
-        print(f"\n  Enter number:\n")
+        out = ["ALL PROMPTS\n"]
+        for p, row in zip(PROMPTS, PROMPT_ROWS):
+            out.append(f"  {CHECKBOX[p['id'] in used_today]} {row}")
+        out.append("\n  Enter number:\n")
+        print("\n".join(out))
         num = input("  → ").strip()
-        try:
-            idx = int(num) - 1
-            if 0 <= idx < len(PROMPTS):
-                prompt = PROMPTS[idx]
-            else:
-                prompt = random.choice(unused)
-        except ValueError:
+        n = parse_int(num)
+        if n is not None and 0 < n <= len(PROMPTS):
+            prompt = PROMPTS[n - 1]
+        else:
             prompt = random.choice(unused)
     else:
         prompt = random.choice(unused)
 
     # Show prompt and start session
     clear()
-    print("=" * 60)
-    print(f"\n  THEME: {prompt['theme']}")
-    print(f"\n  {prompt['text']}\n")
-    print("=" * 60)
-    print("\n  [10 minutes to think and expand]")
-    print("  [Press ENTER when ready to start]\n")
+    print("\n".join([
+        RULE_HEAVY,
+        f"\n  THEME: {prompt['theme']}",
+        f"\n  {prompt['text']}\n",
+        RULE_HEAVY,
+        "\n  [10 minutes to think and expand]",
+        "  [Press ENTER when ready to start]\n",
+    ]))
     input()
 
     clear()
-    print("=" * 60)
-    print(f"  THEME: {prompt['theme']}")
-    print(f"  {prompt['text']}")
-    print("=" * 60)
-    print("\n  Timer started. Think freely. Write if you want.\n")
-    print("  Type your thoughts below (optional):")
-    print("─" * 60)
-    print("\n[Type thoughts, press Ctrl+D when done]\n")
+    print("\n".join([
+        RULE_HEAVY,
+        f"  THEME: {prompt['theme']}",
+        f"  {prompt['text']}",
+        RULE_HEAVY,
+        "\n  Timer started. Think freely. Write if you want.\n",
+        "  Type your thoughts below (optional):",
+        RULE,
+        "\n[Type thoughts, press Ctrl+D when done]\n",
+    ]))
 
     start_time = time.time()
     duration = 600
@@ -506,34 +731,31 @@ def cmd_think():
 
     # Distill
     clear()
-    print("\n" + "=" * 60)
-    print("\n  TIME'S UP")
-    print("\n" + "=" * 60)
-    print("\n  Distill your thinking into the essential insight.\n")
+    out = [
+        "\n" + RULE_HEAVY,
+        "\n  TIME'S UP",
+        "\n" + RULE_HEAVY,
+        "\n  Distill your thinking into the essential insight.\n",
+    ]
 
     if freewrite:
-        print("  Your expansion:")
-        print("  " + "-" * 58)
-        for line in freewrite.split("\n")[:10]:
-            print(f"  {line}")
-        if len(freewrite.split("\n")) > 10:
-            print("  ...")
-        print("  " + "-" * 58 + "\n")
+        out.append("  Your expansion:")
+        out.append(RULE_INDENT)
+        out.extend(f"  {line}" for line in lines[:10])
+        if len(lines) > 10:
+            out.append("  ...")
+        out.append(RULE_INDENT + "\n")
 
-    print("  Core insight (1-3 sentences):\n")
+    out.append("  Core insight (1-3 sentences):\n")
+    print("\n".join(out))
 
     insight_lines = []
-    print("  → ", end="", flush=True)
     try:
-        while True:
-            line = input()
+        while len(insight_lines) < 3:
+            line = input("  → ")
             if not line:
                 break
             insight_lines.append(line)
-            if len(insight_lines) < 3:
-                print("  → ", end="", flush=True)
-            else:
-                break
     except (EOFError, KeyboardInterrupt):
         pass
 
@@ -541,7 +763,7 @@ def cmd_think():
 
     if not insight:
         print("\n  Session cancelled (no insight captured)\n")
-        input("  Press Enter to continue...")
+        pause("  Press Enter to continue...")
         return
 
     # Save session
@@ -555,34 +777,21 @@ def cmd_think():
     }
     thinking_log["sessions"].append(session)
 
-    with open(thinking_json, "w") as f:
-        json.dump(thinking_log, f, indent=2)
+    write_atomic(thinking_json, json_dumps(thinking_log))
 
     # Write thinking markdown
-    thinking_md = thinking_dir / f"{date.today().isoformat()}.md"
-    md = f"---\ndate: {date.today().isoformat()}\nsessions: {len(thinking_log['sessions'])}\n---\n\n"
-    md += f"# Thinking Sessions — {date.today().isoformat()}\n\n"
-
-    for i, s in enumerate(thinking_log["sessions"], 1):
-        ts = datetime.fromisoformat(s["timestamp"]).strftime("%H:%M")
-        md += f"## Session {i} — {ts}\n"
-        md += f"**Theme:** {s['theme']}\n\n"
-        md += f"**Prompt:** {s['prompt']}\n\n"
-        if s.get("freewrite"):
-            md += f"### Expansion\n{s['freewrite']}\n\n"
-        md += f"### Insight\n{s['insight']}\n\n"
-        md += "---\n\n"
-
-    thinking_md.write_text(md)
+    thinking_md = thinking_dir / f"{today}.md"
+    thinking_md.write_text(render_thinking_note(thinking_log))
 
     print("\n  Session captured.\n")
-    input("  Press Enter to continue...")
+    pause("  Press Enter to continue...")
 
 
 def cmd_reconcile():
     """Evening reconciliation."""
     clear()
-    data = load_sidecar()
+    today = date.today()
+    data = load_sidecar(today)
     data = ensure_habits(data)
 
     print("RECONCILIATION\n")
@@ -608,13 +817,11 @@ def cmd_reconcile():
     data["tomorrow"] = tomorrow
     data["reconciled"] = True
 
-    for h in data["habits"]:
-        if h["name"] == "Evening reconcile":
-            h["done"] = True
+    mark_habit(data, "Evening reconcile")
 
-    save_daily(data)
+    save_daily(data, today)
     print("\n  Reconciled.\n")
-    input("Press Enter to continue...")
+    pause()
 
 
 def cmd_weekly_review():
@@ -624,10 +831,8 @@ def cmd_weekly_review():
     # Find Monday of this week
     monday = today - timedelta(days=today.weekday())
     sunday = monday + timedelta(days=6)
-    week_label = f"{monday.isocalendar()[0]}-W{monday.isocalendar()[1]:02d}"
-
-    print(f"WEEKLY REVIEW — {week_label}\n")
-    print(f"  {monday.isoformat()} → {sunday.isoformat()}\n")
+    iso_year, iso_week, _ = monday.isocalendar()
+    week_label = f"{iso_year}-W{iso_week:02d}"
 
     # Aggregate week data
     days_reconciled = 0
@@ -646,7 +851,7 @@ def cmd_weekly_review():
         m = data.get("mits", [])
         md = data.get("mit_done", [])
         total_mits += len(m)
-        mits_done += sum(1 for x in md if x)
+        mits_done += sum(map(bool, md))
         caps = data.get("captures", [])
         total_captures += len(caps)
         for cap in caps:
@@ -656,19 +861,24 @@ def cmd_weekly_review():
         if data.get("energy_sleep") is not None:
             sleep_scores.append(data["energy_sleep"])
 
+    avg_sleep = sum(sleep_scores) / len(sleep_scores) if sleep_scores else None
+
     # Show summary
-    print("─" * 50)
-    print(f"  Days reconciled:  {days_reconciled}/7")
-    print(f"  MITs completed:   {mits_done}/{total_mits}")
-    print(f"  Captures:         {total_captures}")
-    if sleep_scores:
-        avg = sum(sleep_scores) / len(sleep_scores)
-        print(f"  Avg sleep:        {avg:.1f}/10")
+    out = [
+        f"WEEKLY REVIEW — {week_label}\n",
+        f"  {monday.isoformat()} → {sunday.isoformat()}\n",
+        RULE_SHORT,
+        f"  Days reconciled:  {days_reconciled}/7",
+        f"  MITs completed:   {mits_done}/{total_mits}",
+        f"  Captures:         {total_captures}",
+    ]
+    if avg_sleep is not None:
+        out.append(f"  Avg sleep:        {avg_sleep:.1f}/10")
     if drifts:
-        print(f"\n  Drift patterns:")
-        for d in drifts:
-            print(d)
-    print("─" * 50 + "\n")
+        out.append("\n  Drift patterns:")
+        out += drifts
+    out.append(RULE_SHORT + "\n")
+    print("\n".join(out))
 
     # Review questions
     print("What worked this week?")
@@ -682,9 +892,10 @@ def cmd_weekly_review():
 
     # Unprocessed captures
     if all_captures:
-        print(f"\n  {len(all_captures)} capture(s) this week:")
+        out = [f"\n  {len(all_captures)} capture(s) this week:"]
         for cap in all_captures:
-            print(f"    [{cap['date']} {cap.get('time','')}] {cap.get('text','')}")
+            out.append(f"    [{cap['date']} {cap.get('time','')}] {cap.get('text','')}")
+        print("\n".join(out))
 
     # Write weekly review
     weekly_dir = Z / "Weekly"
@@ -708,9 +919,8 @@ def cmd_weekly_review():
         f"- **Captures:** {total_captures}",
     ]
 
-    if sleep_scores:
-        avg = sum(sleep_scores) / len(sleep_scores)
-        md.append(f"- **Avg sleep:** {avg:.1f}/10")
+    if avg_sleep is not None:
+        md.append(f"- **Avg sleep:** {avg_sleep:.1f}/10")
 
     if drifts:
         md += ["", "### Drift Patterns"]
@@ -740,22 +950,21 @@ def cmd_weekly_review():
 
     # Also save JSON sidecar
     weekly_json = weekly_dir / f"{week_label}.json"
-    with open(weekly_json, "w") as f:
-        json.dump({
-            "week": week_label,
-            "start_date": monday.isoformat(),
-            "end_date": sunday.isoformat(),
-            "days_reconciled": days_reconciled,
-            "total_mits": total_mits,
-            "mits_done": mits_done,
-            "total_captures": total_captures,
-            "worked": worked,
-            "didnt_work": didnt,
-            "change": change,
-        }, f, indent=2)
+    write_atomic(weekly_json, json_dumps({
+        "week": week_label,
+        "start_date": monday.isoformat(),
+        "end_date": sunday.isoformat(),
+        "days_reconciled": days_reconciled,
+        "total_mits": total_mits,
+        "mits_done": mits_done,
+        "total_captures": total_captures,
+        "worked": worked,
+        "didnt_work": didnt,
+        "change": change,
+    }))
 
     print(f"\n  Weekly review saved to {week_label}.md\n")
-    input("Press Enter to continue...")
+    pause()
 
 
 def cmd_view_today():
@@ -769,62 +978,69 @@ def cmd_view_today():
     captures = data.get("captures", [])
     habits = data.get("habits", [])
 
-    print(f"TODAY — {date.today().isoformat()}\n")
+    out = [f"TODAY — {data['date']}\n"]
 
     # MITs
     if mits:
-        print("  MITs:")
+        out.append("  MITs:")
         for i, mit in enumerate(mits):
             done = mit_done[i] if i < len(mit_done) else False
-            print(f"    {'[x]' if done else '[ ]'} {i+1}. {mit}")
-        print()
+            out.append(f"    {CHECKBOX[bool(done)]} {i+1}. {mit}")
+        out.append("")
 
     # Captures
     if captures:
-        print(f"  Captures ({len(captures)}):")
+        out.append(f"  Captures ({len(captures)}):")
         for cap in captures:
-            print(f"    [{cap.get('time','')}] {cap.get('text','')}")
-        print()
+            out.append(f"    [{cap.get('time','')}] {cap.get('text','')}")
+        out.append("")
 
     # Energy
     if data.get("energy_sleep") is not None:
-        print(f"  Energy:")
-        print(f"    Sleep: {data['energy_sleep']}/10")
+        out.append(f"  Energy:")
+        out.append(f"    Sleep: {data['energy_sleep']}/10")
         if data.get("energy_movement"):
-            print(f"    Movement: {data['energy_movement']}")
+            out.append(f"    Movement: {data['energy_movement']}")
         if data.get("energy_fuel"):
-            print(f"    Fuel: {data['energy_fuel']}")
-        print()
+            out.append(f"    Fuel: {data['energy_fuel']}")
+        out.append("")
 
     # Habits
     if habits:
-        print("  Habits:")
+        out.append("  Habits:")
         for h in habits:
-            print(f"    {'[x]' if h['done'] else '[ ]'} {h['name']}")
-        print()
+            out.append(f"    {CHECKBOX[bool(h['done'])]} {h['name']}")
+        out.append("")
 
     # Reconciliation
     if data.get("reconciled"):
-        print("  Reconcile:")
-        print(f"    RESULT: {data.get('result', '')}")
-        print(f"    ATTENTION: {data.get('attention', '')}")
+        out.append("  Reconcile:")
+        out.append(f"    RESULT: {data.get('result', '')}")
+        out.append(f"    ATTENTION: {data.get('attention', '')}")
         if data.get("drift"):
-            print(f"    DRIFT: {data['drift']}")
-        print(f"    TOMORROW LOCK: {data.get('tomorrow', '')}")
-        print()
+            out.append(f"    DRIFT: {data['drift']}")
+        out.append(f"    TOMORROW LOCK: {data.get('tomorrow', '')}")
+        out.append("")
     else:
-        print("  Not yet reconciled.\n")
+        out.append("  Not yet reconciled.\n")
 
-    input("Press Enter to continue...")
+    print("\n".join(out))
+    pause()
+
+
+def truncate(text, width=60):
+    """Cut text to width characters, marking the cut with '...'."""
+    return text if len(text) <= width else text[:width] + "..."
 
 
 def cmd_view_past():
     """Show past 7 days."""
     clear()
-    print("PAST 7 DAYS\n")
+    out = ["PAST 7 DAYS\n"]
 
+    today = date.today()
     for i in range(7):
-        d = date.today() - timedelta(days=i)
+        d = today - timedelta(days=i)
         data = load_sidecar(d)
 
         has_data = data.get("reconciled") or data.get("mits") or data.get("captures")
@@ -833,9 +1049,7 @@ def cmd_view_past():
 
         mits = data.get("mits", [])
         mit_done = data.get("mit_done", [])
-        mit_done_count = sum(1 for x in mit_done if x)
-
-        print(f"  {d.isoformat()}", end="")
+        mit_done_count = sum(map(bool, mit_done))
 
         parts = []
         if mits:
@@ -846,19 +1060,20 @@ def cmd_view_past():
             parts.append(f"sleep {data['energy_sleep']}/10")
 
         if parts:
-            print(f"  ({', '.join(parts)})")
+            out.append(f"  {d.isoformat()}  ({', '.join(parts)})")
         else:
-            print()
+            out.append(f"  {d.isoformat()}")
 
         if data.get("result"):
-            print(f"    Result: {data['result'][:60]}{'...' if len(data.get('result','')) > 60 else ''}")
+            out.append(f"    Result: {truncate(data['result'])}")
         if data.get("tomorrow"):
-            print(f"    Lock: {data['tomorrow'][:60]}{'...' if len(data.get('tomorrow','')) > 60 else ''}")
+            out.append(f"    Lock: {truncate(data['tomorrow'])}")
         if data.get("drift"):
-            print(f"    Drift: {data['drift'][:60]}{'...' if len(data.get('drift','')) > 60 else ''}")
-        print()
+            out.append(f"    Drift: {truncate(data['drift'])}")
+        out.append("")
 
-    input("Press Enter to continue...")
+    print("\n".join(out))
+    pause()
 
 
 def cmd_systems():
@@ -866,41 +1081,27 @@ def cmd_systems():
     clear()
     systems_dir = Z / "Systems"
 
-    docs = [
-        ("1", "Alignment.md"),
-        ("2", "Default Day.md"),
-        ("3", "Minimum Viable Day.md"),
-        ("4", "If-Then Plans.md"),
-        ("5", "Habit Stacks.md"),
-    ]
-
-    print("SYSTEMS\n")
-    for num, name in docs:
-        print(f"  {num} — {name.replace('.md', '')}")
-    print(f"\n  b — Back\n")
+    print(SYSTEMS_MENU)
 
-    choice = input("> ").strip()
-    if choice == "b" or choice == "":
+    name = SYSTEM_DOCS.get(input("> ").strip())
+    if name is None:
         return
 
-    for num, name in docs:
-        if choice == num:
-            p = systems_dir / name
-            if p.exists():
-                clear()
-                print(p.read_text())
-                print("\n" + "─" * 60 + "\n")
-                print("  e — Edit in $EDITOR")
-                print("  b — Back\n")
-                action = input("> ").strip().lower()
-                if action == "e":
-                    import os
-                    editor = os.environ.get("EDITOR", "vim")
-                    os.system(f'{editor} "{p}"')
-            else:
-                print(f"\n  File not found: {p}\n")
-            input("Press Enter to continue...")
-            return
+    p = systems_dir / name
+    text = read_doc(p)
+    if text is not None:
+        clear()
+        print(text)
+        print("\n" + RULE + "\n")
+        print("  e — Edit in $EDITOR")
+        print("  b — Back\n")
+        action = input("> ").strip().lower()
+        if action == "e":
+            editor = os.environ.get("EDITOR", "vim")
+            os.system(f'{editor} "{p}"')
+    else:
+        print(f"\n  File not found: {p}\n")
+    pause()
 
 
 def cmd_reset():
@@ -911,53 +1112,73 @@ def cmd_reset():
     confirm = input("Type 'yes' to confirm: ").strip()
 
     if confirm.lower() == "yes":
-        dp = daily_path()
-        sp = sidecar_path()
-        if dp.exists():
-            dp.unlink()
-        if sp.exists():
-            sp.unlink()
+        # One date for both files, so a reset at midnight can't straddle days
+        dp, sp = day_paths(date.today())
+        dp.unlink(missing_ok=True)
+        sp.unlink(missing_ok=True)
+        _sidecar_cache.pop(sp, None)
+        _note_cache.pop(dp, None)
         print("\n  Reset complete.\n")
     else:
         print("\n  Cancelled.\n")
 
-    input("Press Enter to continue...")
+    pause()
+
+
+INFO_TEXT = "\n".join([
+    "75z — PRODUCTIVITY OS\n",
+    "Commands:",
+    "  a  — Alignment (morning read)",
+    "  m  — MITs (set 3 most important tasks)",
+    "  c  — Capture (quick inbox)",
+    "  e  — Energy (log sleep/movement/fuel)",
+    "  h  — Habits (check off today's habits)",
+    "  t  — Think (10-min zen session)",
+    "  4  — Reconcile (evening ritual)",
+    "  w  — Weekly review",
+    "  v  — View today",
+    "  p  — Past 7 days",
+    "  s  — Systems (view/edit reference docs)",
+    "  r  — Reset today",
+    "  i  — Info",
+    "  q  — Quit\n",
+])
 
 
 def cmd_info():
     """Show info screen."""
     clear()
-    print("75z — PRODUCTIVITY OS\n")
-    print("Commands:")
-    print("  a  — Alignment (morning read)")
-    print("  m  — MITs (set 3 most important tasks)")
-    print("  c  — Capture (quick inbox)")
-    print("  e  — Energy (log sleep/movement/fuel)")
-    print("  h  — Habits (check off today's habits)")
-    print("  t  — Think (10-min zen session)")
-    print("  4  — Reconcile (evening ritual)")
-    print("  w  — Weekly review")
-    print("  v  — View today")
-    print("  p  — Past 7 days")
-    print("  s  — Systems (view/edit reference docs)")
-    print("  r  — Reset today")
-    print("  i  — Info")
-    print("  q  — Quit\n")
-    print(f"Vault: {VAULT}\n")
-    input("Press Enter to continue...")
+    print(f"{INFO_TEXT}\nVault: {VAULT}\n")
+    pause()
 
 
 # ─── Main ─────────────────────────────────────────────────────────────────────
 
 
-def status_line():
+COMMANDS = {
+    "a": cmd_alignment,
+    "m": cmd_mits,
+    "c": cmd_capture,
+    "e": cmd_energy,
+    "h": cmd_habits,
+    "t": cmd_think,
+    "4": cmd_reconcile,
+    "w": cmd_weekly_review,
+    "v": cmd_view_today,
+    "p": cmd_view_past,
+    "s": cmd_systems,
+    "r": cmd_reset,
+    "i": cmd_info,
+}
+
+
+def status_line(d=None):
     """Build the status line for the main menu."""
-    data = load_sidecar()
-    data = ensure_habits(data)
+    data = load_sidecar(d)
 
     mits = data.get("mits", [])
     mit_done = data.get("mit_done", [])
-    mit_done_count = sum(1 for x in mit_done if x)
+    mit_done_count = sum(map(bool, mit_done))
     captures = data.get("captures", [])
     sleep = data.get("energy_sleep")
     movement = data.get("energy_movement")
@@ -987,44 +1208,24 @@ def main():
     ensure_dirs()
 
     while True:
-        clear()
-
-        print("75z\n")
-        print(f"Today: {date.today().isoformat()}")
-        print(status_line())
-        print()
-        print("Commands: a m c e h t 4 w v p s r i q\n")
+        today = date.today()
+        render([
+            "75z",
+            "",
+            f"Today: {today.isoformat()}",
+            status_line(today),
+            "",
+            MENU_COMMANDS,
+            "",
+        ])
 
         cmd = input("> ").strip().lower()
 
         if cmd == "q":
             break
-        elif cmd == "a":
-            cmd_alignment()
-        elif cmd == "m":
-            cmd_mits()
-        elif cmd == "c":
-            cmd_capture()
-        elif cmd == "e":
-            cmd_energy()
-        elif cmd == "h":
-            cmd_habits()
-        elif cmd == "t":
-            cmd_think()
-        elif cmd == "4":
-            cmd_reconcile()
-        elif cmd == "w":
-            cmd_weekly_review()
-        elif cmd == "v":
-            cmd_view_today()
-        elif cmd == "p":
-            cmd_view_past()
-        elif cmd == "s":
-            cmd_systems()
-        elif cmd == "r":
-            cmd_reset()
-        elif cmd == "i":
-            cmd_info()
+        handler = COMMANDS.get(cmd)
+        if handler:
+            handler()
 
 
 if __name__ == "__main__":